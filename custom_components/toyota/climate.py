@@ -11,10 +11,15 @@ from homeassistant.components.climate import (
     ClimateEntityFeature,
     HVACMode,
 )
-from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.const import (
+    ATTR_TEMPERATURE,
+    EVENT_HOMEASSISTANT_STOP,
+    UnitOfTemperature,
+)
 from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity import EntityDescription
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.event import async_track_time_interval
 from pytoyoda.models.endpoints.climate import (
     ACOperations,
     ACParameters,
@@ -23,8 +28,10 @@ from pytoyoda.models.endpoints.climate import (
 )
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
     from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
     from pytoyoda.models.vehicle import Vehicle
@@ -39,6 +46,30 @@ SCAN_INTERVAL = timedelta(seconds=120)
 SETTINGS_DEBOUNCE_DELAY = 5.0
 
 
+class _FrozenClimateControlModel(ClimateControlModel, frozen=True):
+    """Climate control command that rejects attribute assignment."""
+
+
+# Commands are shared between calls, so build them frozen to keep them unchanged
+_CC_START = _FrozenClimateControlModel(command="engine-start")
+_CC_STOP = _FrozenClimateControlModel(command="engine-stop")
+
+# Preset mode to (front_defrost, rear_defrost) mapping
+_PRESET_TO_DEFROST = {
+    "both_defrost": (True, True),
+    "front_defrost": (True, False),
+    "rear_defrost": (False, True),
+    "none": (False, False),
+}
+# Preset mode indexed by (front_defrost << 1) | rear_defrost
+_PRESET_BY_BITS = ("none", "rear_defrost", "front_defrost", "both_defrost")
+
+CLIMATE_ENTITY_DESCRIPTION = EntityDescription(
+    key="climate",
+    name="Climate",
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -46,16 +77,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up Toyota climate entities."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    description = EntityDescription(
-        key="climate",
-        name="Climate",
-    )
 
     entities = []
     for index, vehicle_data in enumerate(coordinator.data):
         if _vehicle_has_climate_capability(vehicle_data["data"]):
             entities.append(
-                ToyotaClimate(coordinator, entry.entry_id, index, description)
+                ToyotaClimate(
+                    coordinator, entry.entry_id, index, CLIMATE_ENTITY_DESCRIPTION
+                )
             )
     async_add_entities(entities)
 
@@ -101,6 +130,7 @@ class ToyotaClimate(ToyotaBaseEntity, ClimateEntity):
     ) -> None:
         """Initialize the climate entity."""
         super().__init__(coordinator, entry_id, vehicle_index, description)
+        self._cache_vehicle_api()
 
         # Initialize with defaults first
         self._attr_target_temperature = 21
@@ -112,14 +142,28 @@ class ToyotaClimate(ToyotaBaseEntity, ClimateEntity):
         self._attr_rear_defrost = False
         self._attr_current_temperature = None
         self._attr_climate_status = False
-
-        # Debouncing state - using HA's task cancellation
-        self._pending_settings_cancel = None
-        self._settings_changed = False
+        self._defrost_idx: int | None = None
+
+        # Climate status is only polled while climate control is on
+        self._unsub_poll: CALLBACK_TYPE | None = None
+
+        # Debounce settings updates to avoid excessive API calls
+        self._debouncer = Debouncer(
+            coordinator.hass,
+            _LOGGER,
+            cooldown=SETTINGS_DEBOUNCE_DELAY,
+            immediate=False,
+            function=self._start_send_climate_settings,
+        )
 
         # Load settings from coordinator if available
         self._load_climate_settings_from_coordinator()
 
+    def _cache_vehicle_api(self) -> None:
+        """Cache the API handle and VIN used by every API call."""
+        self._api = self.vehicle._api  # noqa: SLF001
+        self._vin = self.vehicle.vin
+
     def _load_climate_settings_from_coordinator(self) -> None:
         """Load climate settings from coordinator data if available."""
         try:
@@ -159,23 +203,50 @@ class ToyotaClimate(ToyotaBaseEntity, ClimateEntity):
         """Load defrost settings from climate_settings operations."""
         climate_settings = self.vehicle.climate_settings
         operations = getattr(climate_settings, "operations", [])
-        for operation in filter(lambda o: o.category_name == "defrost", operations):
+        self._defrost_idx = None
+        for idx, operation in enumerate(operations):
+            if operation.category_name != "defrost":
+                continue
+            # Remember where the defrost operation lives so sends can index it
+            self._defrost_idx = idx
             for param in operation.parameters:
                 if param.name == "frontDefrost":
                     self._attr_front_defrost = param.enabled
                 elif param.name == "rearDefrost":
                     self._attr_rear_defrost = param.enabled
+            break
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        # Swap in the new vehicle before reloading its settings
+        self.vehicle = self.coordinator.data[self.index]["data"]
+        self._cache_vehicle_api()
         self._load_climate_settings_from_coordinator()
         super()._handle_coordinator_update()
 
-    @property
-    def should_poll(self) -> bool:
-        """Return True to enable polling."""
-        return True
+    @callback
+    def _start_polling(self) -> None:
+        """Start polling the climate status from the car."""
+        if self._unsub_poll is None:
+            self._unsub_poll = async_track_time_interval(
+                self.hass, self._async_poll, SCAN_INTERVAL
+            )
+
+    @callback
+    def _stop_polling(self) -> None:
+        """Stop polling the climate status from the car."""
+        if self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+
+    async def _async_poll(self, _now: datetime) -> None:
+        """Poll the climate status while climate control is on.
+
+        Args:
+            _now: Current time (required by async_track_time_interval, unused)
+        """
+        await self.async_update()
 
     @property
     def climate_settings_on(self) -> bool | None:
@@ -210,13 +281,9 @@ class ToyotaClimate(ToyotaBaseEntity, ClimateEntity):
     @property
     def preset_mode(self) -> str:
         """Return the current preset mode."""
-        if self.front_defrost and self.rear_defrost:
-            return "both_defrost"
-        if self.front_defrost:
-            return "front_defrost"
-        if self.rear_defrost:
-            return "rear_defrost"
-        return "none"
+        return _PRESET_BY_BITS[
+            (bool(self._attr_front_defrost) << 1) | bool(self._attr_rear_defrost)
+        ]
 
     def _create_climate_settings(self) -> ClimateSettingsModel:
         """Create a ClimateSettingsModel with current defrost settings.
@@ -224,21 +291,18 @@ class ToyotaClimate(ToyotaBaseEntity, ClimateEntity):
         Returns:
             ClimateSettingsModel configured with the specified settings
         """
-        # Start with existing operations
-        ac_operations = self.vehicle.climate_settings.operations.copy()
-
-        # Find and replace the defrost operation
-        for i, operation in enumerate(ac_operations):
-            if operation.category_name == "defrost":
-                # Create new defrost operation with current values
-                ac_operations[i] = ACOperations(
-                    categoryName="defrost",
-                    acParameters=[
-                        ACParameters(enabled=self.front_defrost, name="frontDefrost"),
-                        ACParameters(enabled=self.rear_defrost, name="rearDefrost"),
-                    ],
-                )
-                break
+        # The operations property builds a new list on every access
+        ac_operations = self.vehicle.climate_settings.operations
+
+        # Replace the defrost operation with current values
+        if self._defrost_idx is not None:
+            ac_operations[self._defrost_idx] = ACOperations(
+                categoryName="defrost",
+                acParameters=[
+                    ACParameters(enabled=self.front_defrost, name="frontDefrost"),
+                    ACParameters(enabled=self.rear_defrost, name="rearDefrost"),
+                ],
+            )
 
         return ClimateSettingsModel(
             settingsOn=self.climate_settings_on,
@@ -251,18 +315,10 @@ class ToyotaClimate(ToyotaBaseEntity, ClimateEntity):
         """Set new preset mode."""
         try:
             # Update the underlying defrost attributes based on preset mode
-            if preset_mode == "both_defrost":
-                self._attr_front_defrost = True
-                self._attr_rear_defrost = True
-            elif preset_mode == "front_defrost":
-                self._attr_front_defrost = True
-                self._attr_rear_defrost = False
-            elif preset_mode == "rear_defrost":
-                self._attr_front_defrost = False
-                self._attr_rear_defrost = True
-            else:  # "none"
-                self._attr_front_defrost = False
-                self._attr_rear_defrost = False
+            defrost = _PRESET_TO_DEFROST.get(preset_mode, (False, False))
+            if defrost == (self._attr_front_defrost, self._attr_rear_defrost):
+                return
+            self._attr_front_defrost, self._attr_rear_defrost = defrost
 
             self.async_write_ha_state()
             self._debounce_send_climate_settings()
@@ -273,34 +329,47 @@ class ToyotaClimate(ToyotaBaseEntity, ClimateEntity):
     async def async_update(self) -> None:
         """Update climate settings from the car."""
         if not self.climate_settings_on:
+            # Nothing to poll until climate control is turned on again
+            self._stop_polling()
             return
 
         try:
-            if await self.vehicle.refresh_climate_status():
-                _LOGGER.debug("Climate status refreshed from car")
-                # vehicle.climate_status does not seem to work for some reason
-                response = await self.vehicle._api.get_climate_status(  # noqa: SLF001
-                    self.vehicle.vin
-                )
-                _LOGGER.debug("Climate status fetched %s", response)
-                climate_status = response.payload
-                if climate_status.status:
-                    _LOGGER.debug("Climate is on, sync current temperature")
-                    # car has started heating
-                    self._attr_climate_status = True
-                    self._attr_current_temperature = (
-                        climate_status.current_temperature.value
-                    )
+            refresh_status = await self.vehicle.refresh_climate_status()
+            # Only fetch the status when the car accepted the refresh request
+            if not refresh_status or getattr(refresh_status, "status", None) == 0:
+                return
 
-                elif self._attr_climate_status:
-                    _LOGGER.debug("Climate is now off")
-                    # turn off the climate device
-                    self._attr_hvac_mode = HVACMode.OFF
-                    self._attr_current_temperature = None
-                    # reset the climate status flag
-                    self._attr_climate_status = False
+            _LOGGER.debug("Climate status refreshed from car")
+            # vehicle.climate_status does not seem to work for some reason
+            response = await self._api.get_climate_status(self._vin)
+            _LOGGER.debug("Climate status fetched %s", response)
+            climate_status = response.payload
+            if climate_status.status:
+                current_temperature = climate_status.current_temperature.value
+                if (
+                    self._attr_climate_status
+                    and self._attr_current_temperature == current_temperature
+                ):
+                    # nothing changed since the last poll
+                    return
+                _LOGGER.debug("Climate is on, sync current temperature")
+                # car has started heating
+                self._attr_climate_status = True
+                self._attr_current_temperature = current_temperature
+
+            elif self._attr_climate_status:
+                _LOGGER.debug("Climate is now off")
+                # turn off the climate device
+                self._attr_hvac_mode = HVACMode.OFF
+                self._attr_current_temperature = None
+                # reset the climate status flag
+                self._attr_climate_status = False
+
+            else:
+                # climate has not started yet, nothing to update
+                return
 
-                self.async_write_ha_state()
+            self.async_write_ha_state()
 
         except Exception:  # pylint: disable=W0718
             _LOGGER.exception("Error updating climate settings")
@@ -308,29 +377,30 @@ class ToyotaClimate(ToyotaBaseEntity, ClimateEntity):
     @callback
     def _debounce_send_climate_settings(self) -> None:
         """Debounce climate settings updates to avoid excessive API calls."""
-        # Cancel any pending scheduled call
-        if self._pending_settings_cancel is not None:
-            self._pending_settings_cancel()
-            self._pending_settings_cancel = None
+        # Debouncer on its own throttles to one call per cooldown and keeps the
+        # running timer. Restart it so settings are sent once, after
+        # SETTINGS_DEBOUNCE_DELAY seconds without changes.
+        self._debouncer.async_cancel()
+        self._debouncer.async_schedule_call()
 
-        # Mark that settings have changed
-        self._settings_changed = True
+    @callback
+    def _start_send_climate_settings(self) -> None:
+        """Send climate settings in a task of its own.
 
-        # Schedule the actual send after a delay using HA's event loop
-        self._pending_settings_cancel = async_call_later(
-            self.hass, SETTINGS_DEBOUNCE_DELAY, self._delayed_send_climate_settings
-        )
+        Debouncer ignores calls while its function is running. Keeping the
+        request out of the debouncer means edits made while it is in flight
+        schedule another send instead of being dropped.
+        """
+        self.hass.async_create_task(self._send_climate_settings())
 
-    async def _delayed_send_climate_settings(self, _now: Any) -> None:  # noqa: ANN401
-        """Send settings after debounce delay.
+    async def _flush_settings(self) -> bool:
+        """Cancel any pending debounced update and send settings immediately.
 
-        Args:
-            _now: Current time (required by async_call_later, unused)
+        Returns:
+            True if settings were sent successfully, False on error
         """
-        self._pending_settings_cancel = None
-        if self._settings_changed:
-            await self._send_climate_settings()
-            self._settings_changed = False
+        self._debouncer.async_cancel()
+        return await self._send_climate_settings()
 
     async def _send_climate_settings(self) -> bool:
         """Send climate settings to car.
@@ -341,14 +411,15 @@ class ToyotaClimate(ToyotaBaseEntity, ClimateEntity):
         try:
             climate_settings = self._create_climate_settings()
             _LOGGER.debug("Sending climate settings to car: %s", climate_settings)
-            status = await self.vehicle._api.update_climate_settings(  # noqa: SLF001
-                self.vehicle.vin, climate_settings
+            status = await self._api.update_climate_settings(
+                self._vin, climate_settings
             )
 
             _LOGGER.debug("API response status: %s", status)
 
             # Check if the update was successful
-            if not status or (hasattr(status, "status") and status.status == 0):
+            status_code = getattr(status, "status", None)
+            if not status or status_code == 0:
                 _LOGGER.exception("Failed to send climate settings")
                 return False
 
@@ -368,7 +439,7 @@ class ToyotaClimate(ToyotaBaseEntity, ClimateEntity):
     async def async_set_temperature(self, **kwargs: Any) -> None:  # noqa: ANN401
         """Set new target temperature."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
-        if temperature is None:
+        if temperature is None or temperature == self._attr_target_temperature:
             return
 
         try:
@@ -392,28 +463,25 @@ class ToyotaClimate(ToyotaBaseEntity, ClimateEntity):
         """Turn on the climate control."""
         try:
             # optimistically turn on the climate device
-            self._attr_hvac_mode = HVACMode.HEAT_COOL
-            self.async_write_ha_state()
+            if self._attr_hvac_mode != HVACMode.HEAT_COOL:
+                self._attr_hvac_mode = HVACMode.HEAT_COOL
+                self.async_write_ha_state()
+            self._start_polling()
 
             _LOGGER.debug("Attempting to turn on climate for %s", self.vehicle.alias)
 
-            # Cancel any pending debounced updates
-            if self._pending_settings_cancel is not None:
-                self._pending_settings_cancel()
-                self._pending_settings_cancel = None
-            self._settings_changed = False
-
-            # Send settings immediately when turning on
-            if await self._send_climate_settings():
+            # Flush pending edits so they go out in this single request
+            if await self._flush_settings():
                 # Now send the engine-start command to actually turn on climate
                 _LOGGER.debug("Sending engine-start command to %s", self.vehicle.alias)
 
-                status = await self.vehicle._api.send_climate_control_command(  # noqa: SLF001
-                    self.vehicle.vin, ClimateControlModel(command="engine-start")
+                status = await self._api.send_climate_control_command(
+                    self._vin, _CC_START
                 )
 
                 # Check if the update was successful
-                if not status or (hasattr(status, "status") and status.status == 0):
+                status_code = getattr(status, "status", None)
+                if not status or status_code == 0:
                     _LOGGER.debug("Failed to start engine: %s", status)
                     # The official app sends a notification to the user
                     # Should we send a notification to the user?
@@ -439,23 +507,41 @@ class ToyotaClimate(ToyotaBaseEntity, ClimateEntity):
         """Turn off the climate control."""
         try:
             # optimistically turn off the climate device
-            self._attr_hvac_mode = HVACMode.OFF
-            self.async_write_ha_state()
+            if self._attr_hvac_mode != HVACMode.OFF:
+                self._attr_hvac_mode = HVACMode.OFF
+                self.async_write_ha_state()
 
             _LOGGER.debug("Attempting to turn off climate for %s", self.vehicle.alias)
 
             # Send the engine-stop command to turn off climate
-            if await self.vehicle._api.send_climate_control_command(  # noqa: SLF001
-                self.vehicle.vin, ClimateControlModel(command="engine-stop")
-            ):
+            if await self._api.send_climate_control_command(self._vin, _CC_STOP):
                 _LOGGER.debug("Climate control turned off for %s", self.vehicle.alias)
 
         except Exception:  # pylint: disable=W0718
             _LOGGER.exception("Error turning off climate")
 
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        # Resume polling if the entity is re-added while climate is on
+        if self.climate_settings_on:
+            self._start_polling()
+        # Don't let a debounced send reach the API while hass is shutting down
+        self.async_on_remove(
+            self.hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, self._cancel_pending)
+        )
+
+    @callback
+    def _cancel_pending(self, _event: Event | None = None) -> None:
+        """Cancel any pending settings update and climate status poll.
+
+        Args:
+            _event: Home Assistant stop event (unused)
+        """
+        self._debouncer.async_cancel()
+        self._stop_polling()
+
     async def async_will_remove_from_hass(self) -> None:
         """Clean up when entity is removed."""
         # Cancel any pending scheduled calls
-        if self._pending_settings_cancel is not None:
-            self._pending_settings_cancel()
-            self._pending_settings_cancel = None
+        self._cancel_pending()
@@ -0,0 +1,261 @@
+"""Tests for the Toyota EU community integration climate entity."""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockEntityPlatform,
+    async_fire_time_changed,
+)
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from pytoyoda.models.endpoints.climate import ACOperations
+
+from custom_components.toyota.climate import (
+    CLIMATE_ENTITY_DESCRIPTION,
+    SCAN_INTERVAL,
+    SETTINGS_DEBOUNCE_DELAY,
+    ToyotaClimate,
+)
+
+SUCCESS = SimpleNamespace(status="OK")
+
+
+def _mock_vehicle(other_operations=()):
+    """Return a vehicle with climate settings and a mocked API."""
+    api = MagicMock()
+    api.update_climate_settings = AsyncMock(return_value=SUCCESS)
+    api.send_climate_control_command = AsyncMock(return_value=SUCCESS)
+    api.get_climate_status = AsyncMock()
+
+    defrost = SimpleNamespace(
+        category_name="defrost",
+        parameters=[
+            SimpleNamespace(name="frontDefrost", enabled=False),
+            SimpleNamespace(name="rearDefrost", enabled=False),
+        ],
+    )
+    return SimpleNamespace(
+        vin="VIN123",
+        alias="Test car",
+        _api=api,
+        _vehicle_info=SimpleNamespace(car_model_name="Yaris", brand="T"),
+        climate_settings=SimpleNamespace(
+            temperature=SimpleNamespace(value=21),
+            min_temp=18,
+            max_temp=29,
+            temp_interval=1,
+            operations=[*other_operations, defrost],
+        ),
+        refresh_climate_status=AsyncMock(return_value=SUCCESS),
+    )
+
+
+@pytest.fixture
+async def climate(hass):
+    """Add a Toyota climate entity to hass."""
+    vehicle = _mock_vehicle()
+    coordinator = DataUpdateCoordinator(hass, MagicMock(), name="toyota")
+    coordinator.data = [
+        {"data": vehicle, "statistics": None, "metric_values": True}
+    ]
+    entity = ToyotaClimate(coordinator, "entry", 0, CLIMATE_ENTITY_DESCRIPTION)
+    platform = MockEntityPlatform(hass, domain="climate", platform_name="toyota")
+    await platform.async_add_entities([entity])
+    await hass.async_block_till_done()
+    return entity
+
+
+def _climate_status(on, temperature=None):
+    """Return a climate status response."""
+    return SimpleNamespace(
+        payload=SimpleNamespace(
+            status=on, current_temperature=SimpleNamespace(value=temperature)
+        )
+    )
+
+
+async def _advance(hass, freezer, seconds):
+    """Move time forward and run due timers."""
+    freezer.tick(timedelta(seconds=seconds))
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+
+
+async def test_settings_burst_sends_once(hass, freezer, climate):
+    """Assert a burst of edits results in a single settings update."""
+    api = climate.vehicle._api
+
+    for temperature in (22, 23, 24):
+        await climate.async_set_temperature(temperature=temperature)
+        await _advance(hass, freezer, SETTINGS_DEBOUNCE_DELAY - 1)
+
+    api.update_climate_settings.assert_not_awaited()
+
+    await _advance(hass, freezer, SETTINGS_DEBOUNCE_DELAY)
+
+    api.update_climate_settings.assert_awaited_once()
+    settings = api.update_climate_settings.await_args.args[1]
+    assert settings.temperature == 24
+
+
+async def test_edit_during_send_is_sent(hass, freezer, climate):
+    """Assert an edit made while a settings update is in flight is sent."""
+    api = climate.vehicle._api
+    release = asyncio.Event()
+
+    async def _slow_update(*_args):
+        await release.wait()
+        return SUCCESS
+
+    api.update_climate_settings.side_effect = _slow_update
+
+    await climate.async_set_temperature(temperature=22)
+    # Don't wait for the blocked request to finish
+    freezer.tick(timedelta(seconds=SETTINGS_DEBOUNCE_DELAY + 1))
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await asyncio.sleep(0)
+    assert api.update_climate_settings.call_count == 1
+
+    await climate.async_set_temperature(temperature=23)
+    release.set()
+    await hass.async_block_till_done()
+
+    await _advance(hass, freezer, SETTINGS_DEBOUNCE_DELAY + 1)
+
+    assert api.update_climate_settings.call_count == 2
+    settings = api.update_climate_settings.call_args.args[1]
+    assert settings.temperature == 23
+
+
+async def test_settings_use_current_vehicle_operations(hass, freezer, climate):
+    """Assert defrost settings replace the defrost operation of the new data."""
+    ventilation = ACOperations(categoryName="ventilation")
+    vehicle = _mock_vehicle(other_operations=[ventilation])
+    climate.coordinator.async_set_updated_data(
+        [{"data": vehicle, "statistics": None, "metric_values": True}]
+    )
+
+    await climate.async_set_preset_mode("front_defrost")
+    await _advance(hass, freezer, SETTINGS_DEBOUNCE_DELAY + 1)
+
+    vehicle._api.update_climate_settings.assert_awaited_once()
+    settings = vehicle._api.update_climate_settings.await_args.args[1]
+    assert [o.category_name for o in settings.ac_operations] == [
+        "ventilation",
+        "defrost",
+    ]
+    assert settings.ac_operations[1].ac_parameters[0].enabled is True
+
+
+async def test_poll_timer_lifecycle(hass, freezer, climate):
+    """Assert polling runs while climate is on and stops once the car is off."""
+    vehicle = climate.vehicle
+    vehicle._api.get_climate_status.return_value = _climate_status(True, 19)
+
+    await climate.async_turn_on()
+    assert climate.hvac_mode == HVACMode.HEAT_COOL
+
+    await _advance(hass, freezer, SCAN_INTERVAL.total_seconds())
+    assert vehicle.refresh_climate_status.await_count == 1
+    assert climate.current_temperature == 19
+
+    vehicle._api.get_climate_status.return_value = _climate_status(False)
+    await _advance(hass, freezer, SCAN_INTERVAL.total_seconds())
+    assert vehicle.refresh_climate_status.await_count == 2
+    assert climate.hvac_mode == HVACMode.OFF
+
+    for _ in range(2):
+        await _advance(hass, freezer, SCAN_INTERVAL.total_seconds())
+    assert vehicle.refresh_climate_status.await_count == 2
+    assert climate._unsub_poll is None
+
+
+async def test_poll_stops_after_turn_off(hass, freezer, climate):
+    """Assert turning climate off stops polling the car."""
+    await climate.async_turn_on()
+    await climate.async_turn_off()
+
+    for _ in range(2):
+        await _advance(hass, freezer, SCAN_INTERVAL.total_seconds())
+
+    climate.vehicle.refresh_climate_status.assert_not_awaited()
+    assert climate._unsub_poll is None
+
+
+async def test_poll_stops_after_failed_start(hass, freezer, climate):
+    """Assert a failed engine-start stops polling the car."""
+    api = climate.vehicle._api
+    api.send_climate_control_command.return_value = SimpleNamespace(status=0)
+
+    await climate.async_turn_on()
+    assert climate.hvac_mode == HVACMode.OFF
+
+    for _ in range(2):
+        await _advance(hass, freezer, SCAN_INTERVAL.total_seconds())
+
+    climate.vehicle.refresh_climate_status.assert_not_awaited()
+    assert climate._unsub_poll is None
+
+
+async def test_poll_resumes_after_rename(hass, freezer, climate):
+    """Assert polling resumes when a rename re-adds the entity while on."""
+    climate.vehicle._api.get_climate_status.return_value = _climate_status(True, 19)
+    await climate.async_turn_on()
+
+    er.async_get(hass).async_update_entity(
+        climate.entity_id, new_entity_id="climate.renamed"
+    )
+    await hass.async_block_till_done()
+    assert climate.entity_id == "climate.renamed"
+
+    await _advance(hass, freezer, SCAN_INTERVAL.total_seconds())
+    climate.vehicle.refresh_climate_status.assert_awaited_once()
+
+
+async def test_no_send_after_stop(hass, freezer, climate, caplog):
+    """Assert pending settings and polls are cancelled when hass stops."""
+    await climate.async_turn_on()
+    await climate.async_set_temperature(temperature=24)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    await _advance(hass, freezer, SCAN_INTERVAL.total_seconds())
+    climate.vehicle._api.update_climate_settings.assert_awaited_once()
+    climate.vehicle.refresh_climate_status.assert_not_awaited()
+
+    await climate.async_remove()
+    await hass.async_block_till_done()
+    assert "Unable to remove unknown job listener" not in caplog.text
+
+
+async def test_no_send_after_remove(hass, freezer, climate):
+    """Assert pending settings are cancelled when the entity is removed."""
+    await climate.async_set_temperature(temperature=24)
+
+    await climate.async_remove()
+    await _advance(hass, freezer, SETTINGS_DEBOUNCE_DELAY + 1)
+
+    climate.vehicle._api.update_climate_settings.assert_not_awaited()
+
+
+async def test_settings_sent_after_rename(hass, freezer, climate):
+    """Assert settings are still sent after a rename re-adds the entity."""
+    er.async_get(hass).async_update_entity(
+        climate.entity_id, new_entity_id="climate.renamed"
+    )
+    await hass.async_block_till_done()
+
+    await climate.async_set_temperature(temperature=24)
+    await _advance(hass, freezer, SETTINGS_DEBOUNCE_DELAY + 1)
+
+    climate.vehicle._api.update_climate_settings.assert_awaited_once()